@@ -9,6 +9,7 @@ import pyaudio
 import wave
 import io
 import requests
+from communication_metrics import analyze_transcript, build_feedback_input, format_metrics_summary
 
 # Load environment variables
 load_dotenv()
@@ -329,6 +330,8 @@ At the end of your feedback, provide:
 4. Action Plan: 3 specific, actionable steps the student should take before their next consultation
 5. Resources: 2-3 specific resources (articles, videos, or techniques) the student can use to improve
 
+If pre-computed communication metrics are provided after the transcript, use them as approximate signals for open-ended question use, medical jargon, naming the patient in the Introduction, inquiry about remaining questions at Closure, and turn-length balance. They come from simple keyword rules and can be wrong, so check them against the transcript and correct them where the transcript disagrees. A metric reported as n/a was not measured.
+
 Format your feedback clearly with specific verbatim quotes and actionable suggestions for improvement. Focus on practical, implementable advice that the student can use immediately."""
 
 def get_patient_response(user_input, conversation_history):
@@ -430,12 +433,13 @@ def get_huggingface_response(user_input, conversation_history):
         print(f"Error calling Hugging Face API: {str(e)}")
         return "I'm sorry, there was an error generating a response. Please try again."
 
-def get_epa_feedback(transcript):
+def get_epa_feedback(transcript, metrics_summary=None):
     """Get EPA-based feedback on the consultation using either Ollama or Hugging Face."""
+    feedback_input = build_feedback_input(transcript, metrics_summary)
     if USE_HUGGINGFACE:
-        return get_huggingface_feedback(transcript)
+        return get_huggingface_feedback(feedback_input)
     else:
-        return get_ollama_feedback(transcript)
+        return get_ollama_feedback(feedback_input)
 
 def get_ollama_feedback(transcript):
     """Get feedback using Ollama."""
@@ -561,21 +565,32 @@ def main():
     # Get EPA feedback
     if full_transcript:
         transcript_text = "\n".join(full_transcript)
+        
+        # Show instant rule-based metrics before waiting on the LLM
+        metrics_summary = format_metrics_summary(analyze_transcript(full_transcript, scripted_introduction=True))
+        print("\n📊 === Communication Metrics ===")
+        print(metrics_summary)
+        
         try:
-            feedback = get_epa_feedback(transcript_text)
+            print("\n📝 Generating EPA feedback...")
+            feedback = get_epa_feedback(transcript_text, metrics_summary)
             print("\n📝 === EPA Feedback ===")
             print(feedback)
             
-            # Save transcript and feedback
+            # Save transcript, metrics and feedback
             with open("consultation_transcript.txt", "w") as f:
                 f.write(transcript_text)
+                f.write("\n\n=== Communication Metrics ===\n")
+                f.write(metrics_summary)
                 f.write("\n\n=== EPA Feedback ===\n")
                 f.write(feedback)
         except Exception as e:
             print(f"\n❌ Error getting feedback: {str(e)}")
-            print("💾 Saving transcript without feedback...")
+            print("💾 Saving transcript and metrics without feedback...")
             with open("consultation_transcript.txt", "w") as f:
                 f.write(transcript_text)
+                f.write("\n\n=== Communication Metrics ===\n")
+                f.write(metrics_summary)
     else:
         print("❌ No conversation recorded. Ending session without feedback.")
 
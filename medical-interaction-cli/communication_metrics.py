@@ -0,0 +1,181 @@
+import re
+
+# Speaker names used in the transcript lines written by app.py
+DOCTOR_NAME = "Dr. Alex"
+PATIENT_NAME = "Mr. Johnson"
+PATIENT_SURNAME = "Johnson"
+
+# Number of final doctor turns treated as the Closure section
+CLOSURE_TURNS = 2
+
+# Transcript line pattern, e.g. "🩺 Dr. Alex: How are you feeling today?"
+TURN_PATTERN = re.compile(
+    r"^\s*(?:\S+\s+)?(" + re.escape(DOCTOR_NAME) + "|" + re.escape(PATIENT_NAME) + r"):\s*(.*)$"
+)
+# Sentence boundary that does not break after honorifics such as "Mr. Johnson"
+SENTENCE_SPLIT = re.compile(r"(?<!\bMr\.)(?<!\bMrs\.)(?<!\bMs\.)(?<!\bDr\.)(?<=[.?!])\s+", re.IGNORECASE)
+WORD_PATTERN = re.compile(r"[a-z']+")
+CLAUSE_SPLIT = re.compile(r"[,;]|\s(?:and|or|but)\s")
+FILLER_PATTERN = re.compile(r"^(?:(?:so|and|okay|ok|alright|all right|well|now|um|uh|great|right),?\s+)+")
+
+# Question openers. Speech recognition rarely adds punctuation, so an
+# unpunctuated sentence that starts with one of these counts as a question.
+# The trailing (?![\w']) keeps "can" from matching "can't", and imperative
+# "do not ..." is not a question.
+OPEN_QUESTION = re.compile(
+    r"^(?:what|why|tell me|can you tell me|could you tell me|describe|can you describe|"
+    r"could you describe|explain|walk me through|help me understand|"
+    r"how(?!\s+(?:many|much|long|often|old|far)\b))(?![\w'])"
+)
+CLOSED_QUESTION = re.compile(
+    r"^(?:do(?!\s+not\b)|does|did|is|are|was|were|have|has|had|can|could|will|would|should|"
+    r"any|when|where|who|which|how (?:many|much|long|often|old|far))(?![\w'])"
+)
+
+# Closure check for remaining questions or concerns
+REMAINING_QUESTIONS = re.compile(
+    r"\b(?:any (?:other |more |further |last )?(?:questions|concerns)|"
+    r"anything else|questions for me|what questions do you have|"
+    r"is there anything (?:else )?(?:i can|you'd like|you would like))\b"
+)
+
+# Technical medical terms a patient is unlikely to use in everyday speech.
+# Words patients commonly use themselves (e.g. "nausea", "strep", "viral",
+# "antibiotics") are left out so they are not counted as jargon.
+MEDICAL_JARGON = frozenset([
+    "afebrile", "analgesic", "analgesics", "antipyretic", "bilateral", "cervical",
+    "comorbidities", "comorbidity", "contraindicated", "differential",
+    "dysphagia", "edema", "erythema", "erythematous", "etiology", "exudate",
+    "exudates", "exudative", "febrile", "gastrointestinal", "idiopathic",
+    "lesion", "lesions", "lymphadenopathy", "malaise", "myalgia", "nsaid",
+    "nsaids", "odynophagia", "oropharynx", "palpate", "palpation", "pathogen",
+    "pharyngitis", "pharynx", "prognosis", "prophylaxis", "pyrexia",
+    "rhinorrhea", "scarlatina", "sequelae", "streptococcal", "symptomatic",
+    "tonsillar", "tonsillitis", "urticaria",
+])
+
+
+def parse_turns(transcript):
+    """Split a transcript string or list of lines into (speaker, text) turns."""
+    text = transcript if isinstance(transcript, str) else "\n".join(transcript)
+    turns = []
+    for line in text.splitlines():
+        # Stop at a saved feedback section, e.g. "=== EPA Feedback ==="
+        if line.startswith("==="):
+            break
+        match = TURN_PATTERN.match(line)
+        if match:
+            turns.append([match.group(1), match.group(2).strip()])
+        elif turns and line.strip():
+            # Continuation of a multi-line reply
+            turns[-1][1] = f"{turns[-1][1]} {line.strip()}".strip()
+    return [(speaker, content) for speaker, content in turns]
+
+
+def classify_question(sentence):
+    """Return 'open', 'closed', or None if the sentence is not a question."""
+    text = sentence.strip().lower()
+    if not text or text.endswith((".", "!")):
+        return None
+    # Check every clause so "Hi, Mr. Johnson, how are you?" reads as "how are you?";
+    # an open clause wins, as in "When you swallow, how does it feel?"
+    clauses = [FILLER_PATTERN.sub("", clause.strip()) for clause in CLAUSE_SPLIT.split(text)]
+    if any(OPEN_QUESTION.match(clause) for clause in clauses):
+        return "open"
+    if any(CLOSED_QUESTION.match(clause) for clause in clauses) or text.endswith("?"):
+        return "closed"
+    return None
+
+
+def analyze_transcript(transcript, scripted_introduction=False):
+    """Compute rule- and lexicon-based communication metrics for one transcript.
+
+    Set scripted_introduction when the session opened with a canned greeting the
+    student did not write; the Introduction check is then reported as None.
+    """
+    turns = parse_turns(transcript)
+    doctor_turns = [text for speaker, text in turns if speaker == DOCTOR_NAME]
+    patient_turns = [text for speaker, text in turns if speaker == PATIENT_NAME]
+
+    open_questions = 0
+    closed_questions = 0
+    doctor_words = []
+    for text in doctor_turns:
+        for sentence in SENTENCE_SPLIT.split(text):
+            kind = classify_question(sentence)
+            if kind == "open":
+                open_questions += 1
+            elif kind == "closed":
+                closed_questions += 1
+        doctor_words.extend(WORD_PATTERN.findall(text.lower()))
+
+    patient_word_count = sum(len(WORD_PATTERN.findall(text.lower())) for text in patient_turns)
+    doctor_word_count = len(doctor_words)
+    total_words = doctor_word_count + patient_word_count
+    total_questions = open_questions + closed_questions
+    jargon_terms = sorted({word for word in doctor_words if word in MEDICAL_JARGON})
+    jargon_count = sum(1 for word in doctor_words if word in MEDICAL_JARGON)
+
+    introduction = doctor_turns[0].lower() if doctor_turns else ""
+    closure = " ".join(doctor_turns[-CLOSURE_TURNS:]).lower()
+
+    return {
+        "doctor_turns": len(doctor_turns),
+        "patient_turns": len(patient_turns),
+        "open_questions": open_questions,
+        "closed_questions": closed_questions,
+        "open_question_ratio": round(open_questions / total_questions, 2) if total_questions else None,
+        "jargon_count": jargon_count,
+        "jargon_density": round(jargon_count / doctor_word_count, 3) if doctor_word_count else 0.0,
+        "jargon_terms": jargon_terms,
+        "patient_named_in_introduction": None if scripted_introduction else PATIENT_SURNAME.lower() in introduction,
+        "asked_remaining_questions": bool(REMAINING_QUESTIONS.search(closure)),
+        "doctor_words_per_turn": round(doctor_word_count / len(doctor_turns), 1) if doctor_turns else 0.0,
+        "patient_words_per_turn": round(patient_word_count / len(patient_turns), 1) if patient_turns else 0.0,
+        "doctor_talk_share": round(doctor_word_count / total_words, 2) if total_words else 0.0,
+    }
+
+
+def analyze_transcripts(transcripts):
+    """Compute metrics for each transcript in turn; a simple loop over analyze_transcript."""
+    return [analyze_transcript(transcript) for transcript in transcripts]
+
+
+def analyze_transcript_files(paths):
+    """Compute metrics for saved transcript files such as consultation_transcript.txt."""
+    transcripts = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            transcripts.append(f.read())
+    return analyze_transcripts(transcripts)
+
+
+def format_metrics_summary(metrics):
+    """Format metrics as a compact, human- and LLM-readable summary."""
+    jargon_terms = ", ".join(metrics["jargon_terms"]) or "none"
+    open_ratio = metrics["open_question_ratio"]
+    open_ratio = "n/a" if open_ratio is None else f"{open_ratio:.0%}"
+    named = metrics["patient_named_in_introduction"]
+    named = "n/a (scripted greeting)" if named is None else ("yes" if named else "no")
+    return "\n".join([
+        f"- Questions: {metrics['open_questions']} open / {metrics['closed_questions']} closed "
+        f"(open ratio {open_ratio})",
+        f"- Medical jargon: {metrics['jargon_count']} terms, density {metrics['jargon_density']:.1%} "
+        f"({jargon_terms})",
+        f"- Introduction names patient: {named}",
+        f"- Closure asks for remaining questions: {'yes' if metrics['asked_remaining_questions'] else 'no'}",
+        f"- Turn balance: {metrics['doctor_turns']} doctor / {metrics['patient_turns']} patient turns, "
+        f"{metrics['doctor_words_per_turn']} vs {metrics['patient_words_per_turn']} words per turn, "
+        f"doctor talk share {metrics['doctor_talk_share']:.0%}",
+    ])
+
+
+def build_feedback_input(transcript, metrics_summary=None):
+    """Attach pre-computed communication metrics to the transcript sent to the LLM."""
+    if not metrics_summary:
+        return transcript
+    return (
+        f"{transcript}\n\n"
+        "Pre-computed communication metrics (approximate; verify against the transcript):\n"
+        f"{metrics_summary}"
+    )
@@ -0,0 +1,181 @@
+from communication_metrics import (
+    analyze_transcript,
+    analyze_transcript_files,
+    analyze_transcripts,
+    build_feedback_input,
+    classify_question,
+    format_metrics_summary,
+    parse_turns,
+)
+
+
+def test_parse_turns_from_list():
+    turns = parse_turns([
+        "🩺 Dr. Alex: How are you feeling today?",
+        "😷 Mr. Johnson: Not very good.",
+    ])
+    assert turns == [
+        ("Dr. Alex", "How are you feeling today?"),
+        ("Mr. Johnson", "Not very good."),
+    ]
+
+
+def test_parse_turns_from_string_stops_at_feedback_section():
+    transcript = (
+        "🩺 Dr. Alex: When did this start?\n"
+        "😷 Mr. Johnson: Two days ago.\n"
+        "\n"
+        "=== EPA Feedback ===\n"
+        "🩺 Dr. Alex: This line is part of the feedback.\n"
+    )
+    assert parse_turns(transcript) == [
+        ("Dr. Alex", "When did this start?"),
+        ("Mr. Johnson", "Two days ago."),
+    ]
+
+
+def test_parse_turns_keeps_multi_line_turns():
+    assert parse_turns(["😷 Mr. Johnson: Sore throat.\nAlso a fever."]) == [
+        ("Mr. Johnson", "Sore throat. Also a fever."),
+    ]
+    assert parse_turns("😷 Mr. Johnson: Sore throat.\nAlso a fever.\n\n🩺 Dr. Alex: I see.") == [
+        ("Mr. Johnson", "Sore throat. Also a fever."),
+        ("Dr. Alex", "I see."),
+    ]
+
+
+def test_classify_open_questions():
+    assert classify_question("What brings you in today?") == "open"
+    assert classify_question("So, tell me more about the pain") == "open"
+    assert classify_question("Hi, Mr. Johnson, how are you feeling today?") == "open"
+    assert classify_question("What brings you in today, Mr. Johnson?") == "open"
+    assert classify_question("When you swallow, how does it feel?") == "open"
+    assert classify_question("Where does it hurt and what makes it worse?") == "open"
+
+
+def test_classify_closed_questions():
+    assert classify_question("Do you have any other symptoms?") == "closed"
+    assert classify_question("How long has this been going on?") == "closed"
+    assert classify_question("Okay, any other questions?") == "closed"
+    assert classify_question("You took Tylenol?") == "closed"
+
+
+def test_classify_statements():
+    assert classify_question("What I'll do is take a look at your throat.") is None
+    assert classify_question("Any pain will go away soon.") is None
+    assert classify_question("Can't say for sure.") is None
+    assert classify_question("Can't say for sure") is None
+    assert classify_question("I'm sorry to hear that!") is None
+    assert classify_question("") is None
+
+
+def test_classify_unpunctuated_speech():
+    assert classify_question("how are you feeling today") == "open"
+    assert classify_question("did you take anything for it") == "closed"
+    assert classify_question("that sounds painful") is None
+    assert classify_question("I see, do not worry about it") is None
+    assert classify_question("do not worry about it") is None
+    assert classify_question("is it sore or itchy") == "closed"
+
+
+def test_honorifics_do_not_split_questions():
+    metrics = analyze_transcript(["🩺 Dr. Alex: What brings you in today, Mr. Johnson? I'm Dr. Alex."])
+    assert metrics["open_questions"] == 1
+    assert metrics["closed_questions"] == 0
+
+
+def test_introduction_and_closure_detection():
+    metrics = analyze_transcript([
+        "🩺 Dr. Alex: Hi, Mr. Johnson, I'm Alex.",
+        "😷 Mr. Johnson: Hi.",
+        "🩺 Dr. Alex: When did this start?",
+        "😷 Mr. Johnson: Two days ago.",
+        "🩺 Dr. Alex: Do you have any other questions for me?",
+        "😷 Mr. Johnson: No, thanks.",
+    ])
+    assert metrics["patient_named_in_introduction"] is True
+    assert metrics["asked_remaining_questions"] is True
+
+    metrics = analyze_transcript([
+        "🩺 Dr. Alex: Hi, I'm Alex.",
+        "😷 Mr. Johnson: Hi.",
+        "🩺 Dr. Alex: We'll get a throat swab.",
+    ])
+    assert metrics["patient_named_in_introduction"] is False
+    assert metrics["asked_remaining_questions"] is False
+
+
+def test_scripted_introduction_is_not_measured():
+    greeting = "🩺 Dr. Alex: Hi, Mr. Johnson, my name is Alex. Does that sound alright?"
+    metrics = analyze_transcript([greeting, "😷 Mr. Johnson: Sure."], scripted_introduction=True)
+    assert metrics["patient_named_in_introduction"] is None
+    assert "Introduction names patient: n/a" in format_metrics_summary(metrics)
+
+    metrics = analyze_transcript(["🩺 Dr. Alex: What brings you in?"], scripted_introduction=True)
+    assert metrics["patient_named_in_introduction"] is None
+
+
+def test_jargon_ignores_everyday_words():
+    metrics = analyze_transcript(["🩺 Dr. Alex: Any nausea? It may be strep, or pharyngitis with exudate."])
+    assert metrics["jargon_terms"] == ["exudate", "pharyngitis"]
+    assert metrics["jargon_count"] == 2
+
+
+def test_turn_balance():
+    metrics = analyze_transcript([
+        "🩺 Dr. Alex: How are you?",
+        "😷 Mr. Johnson: My throat is really sore.",
+    ])
+    assert metrics["doctor_words_per_turn"] == 3.0
+    assert metrics["patient_words_per_turn"] == 5.0
+    assert metrics["doctor_talk_share"] == 0.38
+
+
+def test_empty_transcript():
+    metrics = analyze_transcript([])
+    assert metrics["doctor_turns"] == 0
+    assert metrics["open_question_ratio"] is None
+    assert metrics["jargon_density"] == 0.0
+    assert metrics["doctor_words_per_turn"] == 0.0
+    assert metrics["patient_words_per_turn"] == 0.0
+    assert metrics["doctor_talk_share"] == 0.0
+    assert "open ratio n/a" in format_metrics_summary(metrics)
+
+
+def test_no_questions_reports_n_a_ratio():
+    metrics = analyze_transcript(["🩺 Dr. Alex: Let's take a look.", "😷 Mr. Johnson: Okay."])
+    assert metrics["open_question_ratio"] is None
+    assert "open ratio n/a" in format_metrics_summary(metrics)
+
+
+def test_analyze_transcripts_batch():
+    transcripts = [["🩺 Dr. Alex: What brings you in?"], ["🩺 Dr. Alex: Any fever?"]]
+    results = analyze_transcripts(transcripts)
+    assert [r["open_questions"] for r in results] == [1, 0]
+    assert [r["closed_questions"] for r in results] == [0, 1]
+
+
+def test_analyze_transcript_files(tmp_path):
+    path = tmp_path / "consultation_transcript.txt"
+    path.write_text(
+        "🩺 Dr. Alex: What brings you in?\n"
+        "😷 Mr. Johnson: Sore throat.\n"
+        "\n=== EPA Feedback ===\n"
+        "🩺 Dr. Alex: Any fever?\n",
+        encoding="utf-8",
+    )
+    [metrics] = analyze_transcript_files([path])
+    assert metrics["open_questions"] == 1
+    assert metrics["closed_questions"] == 0
+
+
+def test_build_feedback_input():
+    transcript = "🩺 Dr. Alex: What brings you in?"
+    assert build_feedback_input(transcript, None) == transcript
+    assert build_feedback_input(transcript, "") == transcript
+
+    summary = format_metrics_summary(analyze_transcript(transcript))
+    feedback_input = build_feedback_input(transcript, summary)
+    assert feedback_input.startswith(transcript + "\n\n")
+    assert feedback_input.endswith(summary)
+    assert "approximate" in feedback_input